@@ -6,10 +6,10 @@ Features included:
 - OOP: ExpenseTracker class
 - Tkinter GUI with Treeview for listing entries
 - Add / Edit / Delete entries
-- CSV storage (data/expenses.csv) with unique ID
+- CSV storage (data/expenses.csv) with unique ID, append-only edits
 - Monthly summary, filter by date range
 - Budget system with alerts
-- Category pie chart (matplotlib)
+- Category pie chart (matplotlib, embedded in a reusable window)
 - Export to CSV & Excel (openpyxl optional)
 - Simple logging & docstrings
 
@@ -24,21 +24,21 @@ Dependencies (requirements.txt):
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import atexit
 import csv
+import importlib.util
 import os
+import queue
+import sys
+import threading
+from collections import defaultdict
 from datetime import datetime
-import uuid
+from functools import lru_cache
 import logging
 
-# Optional import for Excel export
-try:
-    import openpyxl
-    EXCEL_AVAILABLE = True
-except Exception:
-    EXCEL_AVAILABLE = False
-
-# Matplotlib for charts
-import matplotlib.pyplot as plt
+# openpyxl (Excel export) and matplotlib (charts) are imported on first use
+# to keep startup fast; only check here whether openpyxl is installed.
+EXCEL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
 
 # ---------- Configuration ----------
 DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
@@ -52,8 +52,26 @@ os.makedirs(DATA_DIR, exist_ok=True)
 logging.basicConfig(filename=LOG_FILE, level=logging.INFO,
                     format='%(asctime)s %(levelname)s: %(message)s')
 
-# CSV header
-CSV_FIELDS = ["ID", "Date", "Type", "Amount", "Category", "Note"]
+# Entry fields and CSV header (Op marks each record as ADD / UPD / DEL)
+ENTRY_FIELDS = ["ID", "Date", "Type", "Amount", "Category", "Note"]
+CSV_FIELDS = ENTRY_FIELDS + ["Op"]
+OP_ADD, OP_UPD, OP_DEL = "ADD", "UPD", "DEL"
+
+# Rewrite the file once it holds this many records per live entry
+COMPACT_RATIO = 1.25
+
+# Write buffer for the long-lived append handle
+APPEND_BUFFER = 64 * 1024
+
+# Buffer for whole-file reads and rewrites (default 8 KiB means many syscalls)
+IO_BUFFER = 1 << 20
+
+# Startup load: rows parsed per chunk, and how often the Tk side polls for them
+LOAD_CHUNK = 10_000
+LOAD_POLL_MS = 50
+
+# Pie chart shows this many largest categories; the rest become "Other"
+CHART_TOP_N = 10
 
 
 # ---------- Utility Functions ----------
@@ -66,37 +84,147 @@ def ensure_file():
         logging.info("Created new data file: %s", FILE_NAME)
 
 
+def iter_records(chunk_size=LOAD_CHUNK):
+    """Yield the CSV journal as lists of (op, entry) records, in file order.
+
+    Rows without an Op (older files) count as ADD. DEL records carry only the ID.
+    """
+    ensure_file()
+    with open(FILE_NAME, mode="r", newline='', encoding='utf-8', buffering=IO_BUFFER) as f:
+        # plain csv.reader + column positions: no per-row dict from DictReader
+        reader = csv.reader(f)
+        header = next(reader, CSV_FIELDS)
+        legacy = 'Op' not in header
+        i_id, i_date, i_type, i_amt, i_cat, i_note = (header.index(name) for name in ENTRY_FIELDS)
+        i_op = None if legacy else header.index('Op')
+        intern = sys.intern
+        width = len(header)
+        chunk = []
+        for row in reader:
+            if not row:
+                continue  # blank line
+            if len(row) < width:
+                # missing trailing fields (e.g. no Note) read as empty, like DictReader
+                row += [''] * (width - len(row))
+            entry_id = row[i_id]
+            op = row[i_op] if i_op is not None else OP_ADD
+            if op == OP_DEL:
+                chunk.append((op, {'ID': entry_id}))
+            else:
+                # normalize types; intern the low-cardinality columns so
+                # repeated values share one string object
+                amount = float(row[i_amt])
+                chunk.append((op, {
+                    'ID': entry_id,
+                    'Date': row[i_date],
+                    'Type': intern(row[i_type]),
+                    'Amount': amount,
+                    'AmountStr': f"{amount:.2f}",
+                    'Category': intern(row[i_cat]),
+                    'Note': row[i_note],
+                }))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
 def read_entries():
-    """Read all entries from CSV and return a list of dicts."""
+    """Replay the CSV journal and return (live entries, number of records in file).
+
+    Records are applied in order by ID: UPD replaces the entry in place,
+    DEL removes it.
+    """
+    live = {}
+    records = 0
+    for chunk in iter_records():
+        records += len(chunk)
+        for op, entry in chunk:
+            if op == OP_DEL:
+                live.pop(entry['ID'], None)
+            else:
+                live[entry['ID']] = entry
+    return list(live.values()), records
+
+
+def upgrade_legacy_file():
+    """Rewrite a data file from before the Op column so appended records line up."""
     ensure_file()
-    entries = []
     with open(FILE_NAME, mode="r", newline='', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # normalize types
-            row['Amount'] = float(row['Amount'])
-            entries.append(row)
-    return entries
+        header = next(csv.reader(f), CSV_FIELDS)
+    if 'Op' not in header:
+        entries, _ = read_entries()
+        write_entries(entries)
+
+
+# Date formats seen in older hand-edited files, e.g. "01-09-2025 (Monday)"
+LEGACY_DATE_FORMATS = ("%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d")
+
+
+def month_key(date_str):
+    """Return the 'YYYY-MM' month of a stored Date string.
+
+    Dates written by the app ("%Y-%m-%d %H:%M:%S") are sliced directly;
+    only other formats go through strptime.
+    """
+    if date_str[4:5] == '-' and date_str[:4].isdigit() and date_str[5:7].isdigit():
+        return date_str[:7]
+    return _parse_month(date_str)
+
+
+@lru_cache(maxsize=1024)
+def _parse_month(date_str):
+    """Slow path of month_key, cached since legacy dates repeat per day."""
+    day = date_str.split(' ', 1)[0]
+    for fmt in LEGACY_DATE_FORMATS:
+        try:
+            return datetime.strptime(day, fmt).strftime("%Y-%m")
+        except ValueError:
+            pass
+    return date_str[:7]
+
+
+def _entry_row(entry):
+    """Return the ENTRY_FIELDS row tuple for an entry (Amount with two decimals)."""
+    return (entry['ID'], entry['Date'], entry['Type'], entry['AmountStr'],
+            entry['Category'], entry['Note'])
+
+
+def _to_row(entry, op=OP_ADD):
+    """Return the CSV journal row tuple for an entry."""
+    return _entry_row(entry) + (op,)
 
 
 def write_entries(entries):
     """Overwrite CSV with the provided list of entry dicts."""
     ensure_file()
-    with open(FILE_NAME, mode="w", newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        for e in entries:
-            writer.writerow({k: e[k] for k in CSV_FIELDS})
+    with open(FILE_NAME, mode="w", newline='', encoding='utf-8', buffering=IO_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(_to_row(e) for e in entries)
     logging.info("Wrote %d entries to file", len(entries))
 
 
-def append_entry(entry):
-    """Append a single entry dict to CSV."""
+def export_entries(path, entries):
+    """Write entries to an export CSV at path (ENTRY_FIELDS only, no journal Op)."""
+    with open(path, mode="w", newline='', encoding='utf-8', buffering=IO_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(ENTRY_FIELDS)
+        writer.writerows(_entry_row(e) for e in entries)
+    logging.info("Exported %d entries to %s", len(entries), path)
+
+
+def open_append():
+    """Open the CSV for appending journal records; the caller closes it."""
     ensure_file()
-    with open(FILE_NAME, mode="a", newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-        writer.writerow({k: entry[k] for k in CSV_FIELDS})
-    logging.info("Appended entry ID=%s", entry['ID'])
+    return open(FILE_NAME, mode="a", newline='', encoding='utf-8', buffering=APPEND_BUFFER)
+
+
+def append_entry(writer, entry, op=OP_ADD):
+    """Append a single journal record (ADD, UPD or DEL) through an open csv writer."""
+    writer.writerow(_to_row(entry, op))
+    logging.info("Appended %s for entry ID=%s", op, entry['ID'])
 
 
 # ---------- Main Application Class ----------
@@ -108,12 +236,31 @@ class ExpenseTracker(tk.Tk):
         self.resizable(True, True)
 
         # State
-        self.entries = []
+        self._entries_by_id = {}  # ID -> entry dict; insertion order is file order
+        self._rows = None  # list snapshot of entries for positional access; None = rebuild
+        self._by_month = defaultdict(dict)  # 'YYYY-MM' -> {ID: entry}, in file order
+        self._next_id = 1  # next numeric entry ID
         self.budget = None  # budget as float or None
+        # Running totals are integer paise so repeated add/remove cannot drift
+        self._expense_paise = 0  # running sum of Expense amounts
+        self._category_totals = {}  # Category -> (expense paise, entry count)
+        self._journal_len = 0  # records in the CSV, live or superseded
+        self._filtered = False  # Treeview shows a month filter, not all entries
+        self._filter_rows = None  # entries matching the active month filter
+        self._top = 0  # index of the first row shown in the Treeview
+        self._window = None  # (start, end) slice currently rendered
+        self._row_geom = (25, 20)  # (heading height, row height), measured once drawn
+        self._chart_win = None  # chart Toplevel, created on first use and reused
+        self._append_fh = None  # buffered append handle, kept open between adds
+        self._append_writer = None
+        self._loading = False  # background load in progress; mutations wait
+        self._load_queue = None
+        atexit.register(self._close_append)
 
         # Build UI
         self._build_ui()
         self._load_entries()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
     # ---------------- UI BUILD ----------------
     def _build_ui(self):
@@ -166,11 +313,13 @@ class ExpenseTracker(tk.Tk):
             else:
                 self.tree.column(col, width=120)
 
-        vsb = ttk.Scrollbar(mid, orient="vertical", command=self.tree.yview)
+        # Only the visible rows are kept in the Treeview; the vertical
+        # scrollbar moves that window over the entries (see _yview_proxy).
+        self.vsb = ttk.Scrollbar(mid, orient="vertical", command=self._yview_proxy)
         hsb = ttk.Scrollbar(mid, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+        self.tree.configure(xscrollcommand=hsb.set)
         self.tree.grid(row=0, column=0, sticky='nsew')
-        vsb.grid(row=0, column=1, sticky='ns')
+        self.vsb.grid(row=0, column=1, sticky='ns')
         hsb.grid(row=1, column=0, sticky='ew')
         mid.grid_rowconfigure(0, weight=1)
         mid.grid_columnconfigure(0, weight=1)
@@ -180,6 +329,11 @@ class ExpenseTracker(tk.Tk):
         self.menu.add_command(label="Edit", command=self._on_edit_selected)
         self.menu.add_command(label="Delete", command=self._on_delete_selected)
         self.tree.bind("<Button-3>", self._show_context_menu)
+        self.tree.bind("<Configure>", lambda e: self._render_window())
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_mousewheel)
+        for seq in ("<Up>", "<Down>", "<Prior>", "<Next>"):
+            self.tree.bind(seq, self._on_key_nav)
 
         # Bottom frame: actions
         bottom = ttk.Frame(self, padding=8)
@@ -195,21 +349,311 @@ class ExpenseTracker(tk.Tk):
         ttk.Button(bottom, text="Refresh", command=self._load_entries).pack(side=tk.RIGHT, padx=6)
 
     # ---------------- Data operations ----------------
+    @property
+    def entries(self):
+        """All live entries in file order (a view over the ID index)."""
+        return self._entries_by_id.values()
+
     def _load_entries(self):
-        """Load entries from file into memory and populate Treeview."""
-        self.entries = read_entries()
+        """Reload entries from file; parsing runs on a background thread.
+
+        The worker hands chunks of records to the Tk thread through a queue,
+        so the window paints after the first chunk instead of the whole file.
+        """
+        if self._busy():
+            return
+        self._close_append()  # buffered records must reach the file first
+        upgrade_legacy_file()
+        self._entries_by_id = {}
+        self._rows = None
+        self._by_month = defaultdict(dict)
+        self._expense_paise = 0
+        self._category_totals = {}
+        self._journal_len = 0
         self._populate_tree()
+        self._loading = True
+        self._load_queue = queue.Queue()
+        threading.Thread(target=self._load_entries_chunked, args=(self._load_queue,), daemon=True).start()
+        self.after(LOAD_POLL_MS, self._drain_load_queue)
+
+    def _load_entries_chunked(self, q):
+        """Worker thread: parse the CSV and queue each chunk; None marks the end."""
+        try:
+            for chunk in iter_records():
+                q.put(chunk)
+        except Exception as exc:
+            logging.exception("Failed to load %s", FILE_NAME)
+            q.put(exc)
+        q.put(None)
+
+    def _drain_load_queue(self):
+        """Tk thread: ingest one queued chunk per tick until the worker is done."""
+        try:
+            chunk = self._load_queue.get_nowait()
+        except queue.Empty:
+            self.after(LOAD_POLL_MS, self._drain_load_queue)
+            return
+        if isinstance(chunk, Exception):
+            self._abort_load(chunk)
+            return
+        try:
+            if chunk is None:
+                self._finish_load()
+                return
+            self._ingest_chunk(chunk)
+        except Exception as exc:
+            logging.exception("Failed to ingest %s", FILE_NAME)
+            self._abort_load(exc)
+            return
+        self.after(0, self._drain_load_queue)
+
+    def _abort_load(self, exc):
+        # entries are partial; closing beats any later compaction overwriting the file
+        messagebox.showerror("Load Error", f"Could not read {FILE_NAME}:\n{exc}")
+        self.destroy()
+
+    def _ingest_chunk(self, chunk):
+        """Replay a chunk of journal records into memory and the visible rows."""
+        for op, entry in chunk:
+            old = self._entries_by_id.get(entry['ID'])
+            if op == OP_DEL:
+                if old is not None:
+                    self._discard_entry(old)
+            elif old is not None:
+                # UPD keeps the entry's position
+                self._track_expense(old, -1)
+                old.update(entry)
+                self._track_expense(old)
+            else:
+                self._index_entry(entry)
+        self._journal_len += len(chunk)
+        self._render_window(force=True)
+
+    def _finish_load(self):
+        # numeric IDs continue from the highest one; older UUID rows are skipped
+        self._next_id = 1 + max((int(i) for i in self._entries_by_id if i.isascii() and i.isdigit()), default=0)
+        self._loading = False
+        self._load_queue = None
+        logging.info("Loaded %d entries (%d records)", len(self.entries), self._journal_len)
+
+    def _busy(self):
+        """Tell the user to wait and return True while entries are still loading."""
+        if self._loading:
+            messagebox.showinfo("Please wait", "Entries are still loading.")
+        return self._loading
+
+    def _index_entry(self, entry):
+        """Add an entry to the ID/month indexes and the running totals."""
+        self._entries_by_id[entry['ID']] = entry
+        if self._rows is not None:
+            self._rows.append(entry)
+        self._by_month[month_key(entry['Date'])][entry['ID']] = entry
+        self._track_expense(entry)
+
+    def _discard_entry(self, entry, pos=None):
+        """Remove an entry from the ID/month indexes and the running totals.
+
+        pos is the entry's index in the cached row list when the caller knows
+        it (a delete from the rendered window); otherwise the cache is dropped
+        and rebuilt on the next render.
+        """
+        del self._entries_by_id[entry['ID']]
+        if self._rows is not None:
+            if pos is not None and pos < len(self._rows) and self._rows[pos] is entry:
+                del self._rows[pos]
+            else:
+                self._rows = None
+        self._track_expense(entry, -1)
+        key = month_key(entry['Date'])
+        month = self._by_month[key]
+        del month[entry['ID']]
+        if not month:
+            del self._by_month[key]
+
+    def _track_expense(self, entry, sign=1):
+        """Add (sign=1) or remove (sign=-1) an entry from the running expense totals."""
+        if entry['Type'] != 'Expense':
+            return
+        paise = sign * round(entry['Amount'] * 100)
+        self._expense_paise += paise
+        cat = entry['Category']
+        total, count = self._category_totals.get(cat, (0, 0))
+        count += sign
+        if count:
+            self._category_totals[cat] = (total + paise, count)
+        else:
+            # last expense in this category is gone, drop it from the chart
+            self._category_totals.pop(cat, None)
+
+    def _journal(self, entry, op=OP_ADD):
+        """Append a journal record and compact the file if it has grown stale."""
+        append_entry(self._appender(), entry, op)
+        # one write per user action, so a crash loses nothing already saved
+        self._append_fh.flush()
+        self._journal_len += 1
+        self._compact_if_needed()
+
+    def _appender(self):
+        """Return the csv writer on the long-lived append handle, opening it if needed."""
+        if self._append_fh is None:
+            self._append_fh = open_append()
+            self._append_writer = csv.writer(self._append_fh)
+        return self._append_writer
+
+    def _close_append(self):
+        """Flush and close the append handle; the next record reopens it."""
+        if self._append_fh is not None:
+            self._append_fh.close()
+            self._append_fh = self._append_writer = None
+
+    def _compact(self):
+        """Rewrite the CSV with only the live entries."""
+        if self._loading:
+            return  # entries are still partial
+        self._close_append()
+        write_entries(self.entries)
+        self._journal_len = len(self.entries)
+
+    def _compact_if_needed(self):
+        if self._journal_len > COMPACT_RATIO * len(self.entries):
+            self._compact()
+
+    def _flush_pending(self):
+        """Get the CSV up to date: flush buffered records, compact if stale."""
+        if self._append_fh is not None:
+            self._append_fh.flush()
+        if self._journal_len > len(self.entries):
+            self._compact()
+
+    def _on_close(self):
+        self._flush_pending()
+        self._close_append()
+        self.destroy()
 
     def _populate_tree(self, entries=None):
-        """Populate the Treeview widget with entries."""
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-        use = entries if entries is not None else self.entries
-        for e in use:
-            self.tree.insert('', tk.END, values=(e['ID'], e['Date'], e['Type'], f"{float(e['Amount']):.2f}", e['Category'], e['Note']))
+        """Show entries (default: all) in the Treeview from the top (full reload / filter only)."""
+        self._filtered = entries is not None
+        self._filter_rows = entries
+        self._top = 0
+        self._render_window(force=True)
+
+    @staticmethod
+    def _row_values(e):
+        return (e['ID'], e['Date'], e['Type'], e['AmountStr'], e['Category'], e['Note'])
+
+    @staticmethod
+    def _iid(entry_id):
+        """Treeview item id for an entry ID; the prefix keeps a blank ID off Tk's root item ''."""
+        return 'e' + entry_id
+
+    def _insert_row(self, e):
+        """Insert one entry into the Treeview, keyed by its ID."""
+        self.tree.insert('', tk.END, iid=self._iid(e['ID']), values=self._row_values(e))
+
+    # ---------------- Virtual Treeview ----------------
+    def _view_rows(self):
+        """Entries behind the Treeview as a list: the month filter if active, else all."""
+        if self._filtered:
+            return self._filter_rows
+        if self._rows is None:
+            # rebuilt only after a delete or reload; scrolling slices the cached list
+            self._rows = list(self._entries_by_id.values())
+        return self._rows
+
+    def _visible_rows(self):
+        """Number of rows that fit in the Treeview at its current height."""
+        children = self.tree.get_children()
+        if children:
+            bbox = self.tree.bbox(children[0])
+            if bbox:
+                self._row_geom = (bbox[1], bbox[3])
+        header, row_h = self._row_geom
+        return max(1, (self.tree.winfo_height() - header) // row_h)
+
+    def _render_window(self, force=False):
+        """Insert only the visible slice of rows; re-render only when it moves."""
+        rows = self._view_rows()
+        visible = self._visible_rows()
+        self._top = max(0, min(self._top, len(rows) - visible))
+        window = (self._top, min(len(rows), self._top + visible))
+        if force or window != self._window:
+            selected = self.tree.selection()
+            focus = self.tree.focus()
+            self.tree.delete(*self.tree.get_children())
+            for e in rows[window[0]:window[1]]:
+                self._insert_row(e)
+            self._window = window
+            # keep the selection on rows that are still rendered
+            keep = [iid for iid in selected if self.tree.exists(iid)]
+            if keep:
+                self.tree.selection_set(keep)
+            if focus and self.tree.exists(focus):
+                self.tree.focus(focus)
+        self._update_scrollbar()
+
+    def _append_row(self, entry):
+        """Show a newly appended entry if it lands inside the rendered window."""
+        start, end = self._window
+        if end == len(self.entries) - 1 and end - start < self._visible_rows():
+            self._insert_row(entry)
+            self._window = (start, end + 1)
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        n = len(self._view_rows())
+        start, end = self._window
+        if n:
+            self.vsb.set(start / n, end / n)
+        else:
+            self.vsb.set(0.0, 1.0)
+
+    def _yview_proxy(self, *args):
+        """Scrollbar command: move the rendered window instead of Tk's view."""
+        if args[0] == 'moveto':
+            self._top = int(float(args[1]) * len(self._view_rows()))
+        elif args[0] == 'scroll':
+            step = int(args[1])
+            self._top += step * self._visible_rows() if args[2] == 'pages' else step
+        self._render_window()
+
+    def _on_mousewheel(self, event):
+        # Button-4/5 on X11, MouseWheel with delta on Windows/macOS
+        step = -3 if event.num == 4 or event.delta > 0 else 3
+        self._yview_proxy('scroll', step, 'units')
+        return 'break'
+
+    def _on_key_nav(self, event):
+        """Move the window when Up/Down leave the rendered rows, and on PageUp/PageDown."""
+        children = self.tree.get_children()
+        if not children:
+            return None
+        focus = self.tree.focus()
+        pos = children.index(focus) if focus in children else 0
+        if event.keysym in ('Prior', 'Next'):
+            step = self._visible_rows() * (-1 if event.keysym == 'Prior' else 1)
+        elif event.keysym == 'Up' and pos == 0:
+            step = -1
+        elif event.keysym == 'Down' and pos == len(children) - 1:
+            step = 1
+        else:
+            return None  # Treeview's own binding moves within the window
+        old_top = self._top
+        self._top += step
+        self._render_window()
+        children = self.tree.get_children()
+        if children:
+            # same row as the keypress would reach, clamped to what is rendered
+            target = min(max(pos + step - (self._top - old_top), 0), len(children) - 1)
+            iid = children[target]
+            self.tree.focus(iid)
+            self.tree.selection_set(iid)
+            self.tree.see(iid)
+        return 'break'
 
     def add_entry(self):
         """Collect input fields, validate and append entry."""
+        if self._busy():
+            return
         cat = self.category_var.get().strip()
         amt = self.amount_var.get().strip()
         typ = self.type_var.get()
@@ -219,22 +663,29 @@ class ExpenseTracker(tk.Tk):
             messagebox.showerror("Validation Error", "Category and Amount are required.")
             return
         try:
-            amt_f = float(amt)
+            # two decimals, same as the file and AmountStr, so every total agrees
+            amt_f = round(float(amt), 2)
         except ValueError:
             messagebox.showerror("Validation Error", "Amount must be a number.")
             return
 
         entry = {
-            'ID': str(uuid.uuid4()),
+            'ID': str(self._next_id),
             'Date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'Type': typ,
-            'Amount': f"{amt_f:.2f}",
-            'Category': cat,
+            'Type': sys.intern(typ),
+            'Amount': amt_f,
+            'AmountStr': f"{amt_f:.2f}",
+            'Category': sys.intern(cat),
             'Note': note,
         }
-        append_entry(entry)
-        self.entries.append(entry)
-        self._populate_tree()
+        self._next_id += 1
+        self._index_entry(entry)
+        self._journal(entry)
+        if self._filtered:
+            # adding returns to the full list, as before
+            self._populate_tree()
+        else:
+            self._append_row(entry)
         logging.info("Added entry: %s", entry['ID'])
 
         # clear inputs
@@ -244,28 +695,36 @@ class ExpenseTracker(tk.Tk):
 
         # budget check
         if self.budget is not None and typ == 'Expense':
-            total_exp = sum(float(e['Amount']) for e in self.entries if e['Type'] == 'Expense')
-            if total_exp > self.budget:
+            total_exp = self._expense_paise / 100
+            if self._expense_paise > round(self.budget * 100):
                 messagebox.showwarning("Budget Exceeded", f"You have exceeded your budget of ₹{self.budget:.2f}\.\nTotal expense: ₹{total_exp:.2f}")
 
     def _on_edit_selected(self):
         sel = self.tree.selection()
-        if not sel:
+        if not sel or self._busy():
             return
-        item = self.tree.item(sel[0])
-        entry_id = item['values'][0]
-        self._open_edit_window(entry_id)
+        # Treeview item ids are 'e' + entry ID
+        self._open_edit_window(sel[0][1:])
 
     def _on_delete_selected(self):
         sel = self.tree.selection()
-        if not sel:
+        if not sel or self._busy():
             return
-        item = self.tree.item(sel[0])
-        entry_id = item['values'][0]
+        iid = sel[0]
+        entry_id = iid[1:]
         if messagebox.askyesno("Confirm Delete", "Are you sure you want to delete this entry?"):
-            self.entries = [e for e in self.entries if e['ID'] != entry_id]
-            write_entries(self.entries)
-            self._populate_tree()
+            removed = self._entries_by_id.get(entry_id)
+            if removed is not None:
+                # the row is rendered, so its position in the view is known
+                pos = self._window[0] + self.tree.index(iid)
+                if self._filtered:
+                    del self._filter_rows[pos]
+                    self._discard_entry(removed)
+                else:
+                    self._discard_entry(removed, pos)
+                self._journal(removed, OP_DEL)
+            # rows below shift up into the window
+            self._render_window(force=True)
 
     def _show_context_menu(self, event):
         try:
@@ -274,7 +733,7 @@ class ExpenseTracker(tk.Tk):
             self.menu.grab_release()
 
     def _open_edit_window(self, entry_id):
-        entry = next((e for e in self.entries if e['ID'] == entry_id), None)
+        entry = self._entries_by_id.get(entry_id)
         if not entry:
             messagebox.showerror("Error", "Entry not found")
             return
@@ -287,7 +746,7 @@ class ExpenseTracker(tk.Tk):
         ttk.Entry(win, textvariable=cat_v).grid(row=0, column=1, padx=6)
 
         ttk.Label(win, text="Amount:").grid(row=1, column=0, sticky=tk.W, padx=6, pady=6)
-        amt_v = tk.StringVar(value=entry['Amount'])
+        amt_v = tk.StringVar(value=entry['AmountStr'])
         ttk.Entry(win, textvariable=amt_v).grid(row=1, column=1, padx=6)
 
         ttk.Label(win, text="Type:").grid(row=2, column=0, sticky=tk.W, padx=6, pady=6)
@@ -299,17 +758,29 @@ class ExpenseTracker(tk.Tk):
         ttk.Entry(win, textvariable=note_v, width=40).grid(row=3, column=1, padx=6)
 
         def save_changes():
+            if self._busy():
+                return  # keep the dialog open; the user can save once loading finishes
+            # the entry may have been deleted (or reloaded) while the dialog was open
+            if self._entries_by_id.get(entry['ID']) is not entry:
+                messagebox.showerror("Error", "Entry not found")
+                win.destroy()
+                return
             try:
-                new_amt = float(amt_v.get())
+                new_amt = round(float(amt_v.get()), 2)
             except ValueError:
                 messagebox.showerror("Validation Error", "Amount must be a number.")
                 return
-            entry['Category'] = cat_v.get().strip()
-            entry['Amount'] = f"{new_amt:.2f}"
-            entry['Type'] = type_v.get()
+            self._track_expense(entry, -1)
+            entry['Category'] = sys.intern(cat_v.get().strip())
+            entry['Amount'] = new_amt
+            entry['AmountStr'] = f"{new_amt:.2f}"
+            entry['Type'] = sys.intern(type_v.get())
             entry['Note'] = note_v.get().strip()
-            write_entries(self.entries)
-            self._populate_tree()
+            self._track_expense(entry)
+            self._journal(entry, OP_UPD)
+            iid = self._iid(entry['ID'])
+            if self.tree.exists(iid):
+                self.tree.item(iid, values=self._row_values(entry))
             win.destroy()
 
         ttk.Button(win, text="Save", command=save_changes).grid(row=4, column=0, columnspan=2, pady=8)
@@ -318,8 +789,12 @@ class ExpenseTracker(tk.Tk):
     def show_summary(self, entries=None):
         """Compute total income/expense and show messagebox."""
         use = entries if entries is not None else self.entries
-        income = sum(float(e['Amount']) for e in use if e['Type'] == 'Income')
-        expense = sum(float(e['Amount']) for e in use if e['Type'] == 'Expense')
+        # single pass, totals keyed by Type
+        totals = {}
+        for e in use:
+            totals[e['Type']] = totals.get(e['Type'], 0.0) + e['Amount']
+        income = totals.get('Income', 0.0)
+        expense = totals.get('Expense', 0.0)
         balance = income - expense
         msg = f"💰 Total Income: ₹{income:.2f}\n💸 Total Expense: ₹{expense:.2f}\n📌 Balance: ₹{balance:.2f}"
         if self.budget is not None:
@@ -328,19 +803,53 @@ class ExpenseTracker(tk.Tk):
 
     def show_chart(self, entries=None):
         """Show pie chart of category-wise expenses."""
-        use = entries if entries is not None else self.entries
-        categories = {}
-        for e in use:
-            if e['Type'] == 'Expense':
-                categories[e['Category']] = categories.get(e['Category'], 0) + float(e['Amount'])
+        if entries is None:
+            categories = {cat: paise / 100 for cat, (paise, _) in self._category_totals.items()}
+        else:
+            categories = {}
+            for e in entries:
+                if e['Type'] == 'Expense':
+                    categories[e['Category']] = categories.get(e['Category'], 0.0) + e['Amount']
         if not categories:
             messagebox.showinfo("Info", "No expenses to show in chart")
             return
-        plt.figure(figsize=(6, 6))
-        plt.pie(list(categories.values()), labels=list(categories.keys()), autopct="%1.1f%%")
-        plt.title("Expense Breakdown by Category")
-        plt.tight_layout()
-        plt.show()
+        ranked = sorted(categories.items(), key=lambda kv: kv[1], reverse=True)
+        categories = dict(ranked[:CHART_TOP_N])
+        other = sum(total for _, total in ranked[CHART_TOP_N:])
+        if other > 0:
+            categories['Other'] = categories.get('Other', 0.0) + other
+        win = self._get_chart_window()
+        if win is None:
+            return
+        ax = self._chart_ax
+        ax.clear()
+        ax.pie(list(categories.values()), labels=list(categories.keys()), autopct="%1.1f%%")
+        ax.set_title("Expense Breakdown by Category")
+        self._chart_canvas.draw_idle()
+        win.deiconify()
+        win.lift()
+
+    def _get_chart_window(self):
+        """Return the chart window, building the Figure and canvas once (None if matplotlib is missing)."""
+        if self._chart_win is None:
+            try:
+                # Agg-backed Figure embedded in Tk
+                from matplotlib.figure import Figure
+                from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            except ImportError:
+                messagebox.showerror("Dependency Missing", "matplotlib not installed. Install it to show charts.")
+                return None
+            win = tk.Toplevel(self)
+            win.title("Expense Breakdown")
+            # closing only hides the window so the next chart reuses it
+            win.protocol("WM_DELETE_WINDOW", win.withdraw)
+            # constrained layout is resolved at draw time, no tight_layout pass per chart
+            self._chart_fig = Figure(figsize=(6, 6), constrained_layout=True)
+            self._chart_ax = self._chart_fig.add_subplot()
+            self._chart_canvas = FigureCanvasTkAgg(self._chart_fig, master=win)
+            self._chart_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            self._chart_win = win
+        return self._chart_win
 
     # ---------------- Filters ----------------
     def _open_month_filter(self):
@@ -356,7 +865,11 @@ class ExpenseTracker(tk.Tk):
             if not m:
                 messagebox.showerror("Input Error", "Please enter month in format YYYY-MM")
                 return
-            filtered = [e for e in self.entries if e['Date'].startswith(m)]
+            if len(m) == 7:
+                filtered = list(self._by_month.get(m, {}).values())
+            else:
+                # partial prefixes such as a bare year still scan
+                filtered = [e for e in self.entries if e['Date'].startswith(m)]
             if not filtered:
                 messagebox.showinfo("No Data", f"No records for {m}")
             self._populate_tree(filtered)
@@ -381,28 +894,38 @@ class ExpenseTracker(tk.Tk):
 
     # ---------------- Export ----------------
     def export_csv(self):
+        if self._busy():
+            return
         path = filedialog.asksaveasfilename(defaultextension='.csv', filetypes=[("CSV files", '*.csv')])
         if not path:
             return
-        write_entries(self.entries)
-        # simply copy the data file to chosen path
-        with open(FILE_NAME, 'r', encoding='utf-8') as src, open(path, 'w', encoding='utf-8', newline='') as dst:
-            dst.write(src.read())
+        if os.path.exists(path) and os.path.samefile(path, FILE_NAME):
+            messagebox.showerror("Export Error", "Choose a file other than the tracker's own data file.")
+            return
+        try:
+            export_entries(path, self.entries)
+        except OSError as exc:
+            messagebox.showerror("Export Error", f"Could not write {path}:\n{exc}")
+            return
         messagebox.showinfo("Export", f"Exported CSV to {path}")
 
     def export_excel(self):
+        if self._busy():
+            return
         if not EXCEL_AVAILABLE:
             messagebox.showerror("Dependency Missing", "openpyxl not installed. Install it to export Excel files.")
             return
         path = filedialog.asksaveasfilename(defaultextension='.xlsx', filetypes=[("Excel files", '*.xlsx')])
         if not path:
             return
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.title = "Expenses"
-        ws.append(CSV_FIELDS)
+        import openpyxl
+
+        # write-only workbook streams rows out instead of keeping every Cell in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet("Expenses")
+        ws.append(ENTRY_FIELDS)
         for e in self.entries:
-            ws.append([e[f] for f in CSV_FIELDS])
+            ws.append([e[f] for f in ENTRY_FIELDS])
         wb.save(path)
         messagebox.showinfo("Export", f"Exported Excel to {path}")
 